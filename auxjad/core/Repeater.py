@@ -1,3 +1,5 @@
+from itertools import chain
+
 import abjad
 
 from ..utilities.inspect import inspect
@@ -455,6 +457,8 @@ class Repeater():
 
     __slots__ = ('_contents',
                  '_current_window',
+                 '_current_window_key',
+                 '_indicator_types',
                  '_omit_time_signatures',
                  '_force_identical_time_signatures',
                  '_reposition_clefs',
@@ -527,25 +531,55 @@ class Repeater():
                            n: int,
                            ) -> None:
         r'Repeats a container ``n`` times.'
+        # the output only depends on the contents, on n and on these options
+        # (time signatures are omitted later by current_window), so the
+        # previous window can be reused if none of them has changed
+        key = (n,
+               self._force_identical_time_signatures,
+               self._reposition_clefs,
+               self._reposition_dynamics,
+               self._reposition_slurs,
+               )
+        if key == self._current_window_key:
+            return
         dummy_container = abjad.mutate(self._contents).copy()
-        for _ in range(n - 1):
-            dummy_container.extend(abjad.mutate(self._contents).copy())
-        if not self._force_identical_time_signatures:
+        dummy_container.extend(chain.from_iterable(
+            abjad.mutate(self._contents).copy()[:] for _ in range(n - 1)
+        ))
+        # each of these passes only acts on its own type of indicators, so it
+        # is skipped when the contents do not have any of them
+        if (not self._force_identical_time_signatures
+                and self._has_indicators(abjad.TimeSignature)):
             mutate(dummy_container[:]).remove_repeated_time_signatures()
-        if self._reposition_clefs:
+        if self._reposition_clefs and self._has_indicators(abjad.Clef):
             mutate(dummy_container[:]).reposition_clefs()
-        if self._reposition_clefs:
+        if (self._reposition_dynamics
+                and self._has_indicators(abjad.Dynamic,
+                                         abjad.StartHairpin,
+                                         abjad.StopHairpin,
+                                         )):
             mutate(dummy_container[:]).reposition_dynamics()
-        if self._reposition_clefs:
+        if (self._reposition_slurs
+                and self._has_indicators(abjad.StartSlur, abjad.StopSlur)):
             mutate(dummy_container[:]).reposition_slurs()
         self._current_window = dummy_container[:]
+        self._current_window_key = key
         dummy_container[:] = []
 
+    def _has_indicators(self,
+                        *indicator_classes: type,
+                        ) -> bool:
+        r"""Returns ``True`` if the contents have any indicator of the given
+        classes (or of their child classes).
+        """
+        return any(issubclass(indicator_type, indicator_classes)
+                   for indicator_type in self._indicator_types)
+
     @staticmethod
     def _remove_all_time_signatures(container) -> None:
         r'Removes all time signatures of an |abjad.Container|.'
-        for leaf in abjad.select(container).leaves():
-            if abjad.inspect(leaf).effective(abjad.TimeSignature):
+        for leaf in abjad.iterate(container).leaves():
+            if abjad.inspect(leaf).indicators(abjad.TimeSignature):
                 abjad.detach(abjad.TimeSignature, leaf)
 
     ### PUBLIC PROPERTIES ###
@@ -570,16 +604,21 @@ class Repeater():
             self._contents = abjad.Container([abjad.mutate(contents).copy()])
         else:
             self._contents = abjad.mutate(contents).copy()
-        dummy_container = abjad.mutate(contents).copy()
         try:
-            if not inspect(dummy_container[:]).selection_is_full():
+            if not inspect(self._contents[:]).selection_is_full():
                 mutate(self._contents).close_container()
-                mutate(dummy_container).close_container()
         except ValueError as err:
             raise ValueError("'contents' is malformed, with an underfull "
                              "measure preceding a time signature change"
                              ) from err
+        self._indicator_types = frozenset(
+            type(indicator)
+            for leaf in abjad.iterate(self._contents).leaves()
+            for indicator in abjad.inspect(leaf).indicators()
+        )
+        dummy_container = abjad.mutate(self._contents).copy()
         self._current_window = dummy_container[:]
+        self._current_window_key = None
         dummy_container[:] = []
 
     @property
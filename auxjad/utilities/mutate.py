@@ -17,7 +17,7 @@ from .mutations.remove_repeated_dynamics import remove_repeated_dynamics
 from .mutations.remove_repeated_time_signatures import (
     remove_repeated_time_signatures,
 )
-from .mutations.reposition_clefs import reposition_clefs
+from .mutations.reposition_clefs import _DEFAULT_TREBLE_CLEF, reposition_clefs
 from .mutations.reposition_dynamics import reposition_dynamics
 from .mutations.reposition_slurs import reposition_slurs
 from .mutations.respell_accidentals import respell_accidentals
@@ -25,6 +25,28 @@ from .mutations.rests_to_multimeasure_rest import rests_to_multimeasure_rest
 from .mutations.sustain_notes import sustain_notes
 from .mutations.sync_containers import sync_containers
 
+TimeSignatureLike = Union[abjad.TimeSignature, tuple, list]
+
+_MUTATION_NAMES = (
+    'auto_rewrite_meter',
+    'close_container',
+    'double_barlines_before_time_signatures',
+    'enforce_time_signature',
+    'extract_trivial_tuplets',
+    'fill_with_rests',
+    'merge_partial_tuplets',
+    'prettify_rewrite_meter',
+    'remove_repeated_dynamics',
+    'remove_repeated_time_signatures',
+    'reposition_clefs',
+    'reposition_dynamics',
+    'reposition_slurs',
+    'respell_accidentals',
+    'rests_to_multimeasure_rest',
+    'sustain_notes',
+    'sync_containers',
+)
+
 
 class Mutation:
     r"""Mutation class containing all of Auxjad's mutation methods.
@@ -73,7 +95,7 @@ class Mutation:
 
     def __repr__(self) -> str:
         r'Gets interpreter representation.'
-        return abjad.StorageFormatManager(self).get_repr_format()
+        return f'Mutation(client={self._client!r})'
 
     ### PUBLIC METHODS ###
 
@@ -94,7 +116,7 @@ class Mutation:
                            split_quadruple_meter: bool = True,
                            ) -> None:
         auto_rewrite_meter(
-            self.client,
+            self._client,
             meter_list=meter_list,
             prettify_rewrite_meter=prettify_rewrite_meter,
             extract_trivial_tuplets=extract_trivial_tuplets,
@@ -109,21 +131,18 @@ class Mutation:
         )
 
     def close_container(self) -> None:
-        close_container(self.client)
+        close_container(self._client)
 
     def double_barlines_before_time_signatures(self,
                                                *,
                                                context: Optional[str] = None,
                                                ) -> None:
-        double_barlines_before_time_signatures(self.client,
+        double_barlines_before_time_signatures(self._client,
                                                context=context,
                                                )
 
     def enforce_time_signature(self,
-                               time_signatures: Union[abjad.TimeSignature,
-                                                      tuple,
-                                                      list,
-                                                      ],
+                               time_signatures: TimeSignatureLike,
                                *,
                                cyclic: bool = False,
                                fill_with_rests: bool = True,
@@ -140,7 +159,7 @@ class Mutation:
                                split_quadruple_meter: bool = True,
                                ) -> None:
         enforce_time_signature(
-            self.client,
+            self._client,
             time_signatures=time_signatures,
             cyclic=cyclic,
             fill_with_rests=fill_with_rests,
@@ -174,7 +193,7 @@ class Mutation:
                         split_quadruple_meter: bool = True,
                         ) -> None:
         fill_with_rests(
-            self.client,
+            self._client,
             disable_rewrite_meter=disable_rewrite_meter,
             prettify_rewrite_meter=prettify_rewrite_meter,
             boundary_depth=boundary_depth,
@@ -231,7 +250,7 @@ class Mutation:
     def reposition_clefs(self,
                          *,
                          shift_clef_to_notes: bool = True,
-                         implicit_clef: abjad.Clef = abjad.Clef('treble'),
+                         implicit_clef: abjad.Clef = _DEFAULT_TREBLE_CLEF,
                          ) -> None:
         reposition_clefs(self._client,
                          shift_clef_to_notes=shift_clef_to_notes,
@@ -292,7 +311,7 @@ class Mutation:
                       rewrite_meter: bool = True,
                       ) -> None:
         sustain_notes(
-            self.client,
+            self._client,
             sustain_multimeasure_rests=sustain_multimeasure_rests,
             rewrite_meter=rewrite_meter,
         )
@@ -380,24 +399,6 @@ def mutate(client: Union[abjad.Component,
 
 ### EXTENSION METHODS ###
 
-abjad.Mutation.auto_rewrite_meter = Mutation.auto_rewrite_meter
-abjad.Mutation.close_container = Mutation.close_container
-abjad.Mutation.double_barlines_before_time_signatures = (
-    Mutation.double_barlines_before_time_signatures
-)
-abjad.Mutation.enforce_time_signature = Mutation.enforce_time_signature
-abjad.Mutation.extract_trivial_tuplets = Mutation.extract_trivial_tuplets
-abjad.Mutation.fill_with_rests = Mutation.fill_with_rests
-abjad.Mutation.merge_partial_tuplets = Mutation.merge_partial_tuplets
-abjad.Mutation.prettify_rewrite_meter = Mutation.prettify_rewrite_meter
-abjad.Mutation.remove_repeated_dynamics = Mutation.remove_repeated_dynamics
-abjad.Mutation.remove_repeated_time_signatures = (
-    Mutation.remove_repeated_time_signatures
-)
-abjad.Mutation.reposition_clefs = Mutation.reposition_clefs
-abjad.Mutation.reposition_dynamics = Mutation.reposition_dynamics
-abjad.Mutation.reposition_slurs = Mutation.reposition_slurs
-abjad.Mutation.respell_accidentals = Mutation.respell_accidentals
-abjad.Mutation.rests_to_multimeasure_rest = Mutation.rests_to_multimeasure_rest
-abjad.Mutation.sustain_notes = Mutation.sustain_notes
-abjad.Mutation.sync_containers = Mutation.sync_containers
+for _name in _MUTATION_NAMES:
+    setattr(abjad.Mutation, _name, getattr(Mutation, _name))
+del _name
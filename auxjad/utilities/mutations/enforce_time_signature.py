@@ -1,3 +1,4 @@
+from functools import singledispatch
 from typing import Optional, Union
 
 import abjad
@@ -7,6 +8,43 @@ from .close_container import close_container as close_container_function
 from .fill_with_rests import fill_with_rests as fill_with_rests_function
 
 
+@singledispatch
+def _time_signature_list(time_signatures) -> list[abjad.TimeSignature]:
+    r"""Converts the ``time_signatures`` argument of
+    :func:`enforce_time_signature` into a :obj:`list` of
+    |abjad.TimeSignature|, dispatching on its type."""
+    return _time_signature_list([time_signatures])
+
+
+@_time_signature_list.register
+def _time_signature_list_from_time_signature(
+    time_signatures: abjad.TimeSignature,
+) -> list[abjad.TimeSignature]:
+    return [time_signatures]
+
+
+@_time_signature_list.register
+def _time_signature_list_from_tuple(time_signatures: tuple,
+                                    ) -> list[abjad.TimeSignature]:
+    return [abjad.TimeSignature(time_signatures)]
+
+
+@_time_signature_list.register
+def _time_signature_list_from_list(time_signatures: list,
+                                   ) -> list[abjad.TimeSignature]:
+    if time_signatures[0] is None:
+        raise ValueError("first element of the input list must not be 'None'")
+    time_signatures_ = []
+    for time_signature in time_signatures:
+        if time_signature is None:
+            previous_ts_duration = time_signatures_[-1].pair
+            time_signature = abjad.TimeSignature(previous_ts_duration)
+        elif not isinstance(time_signature, abjad.TimeSignature):
+            time_signature = abjad.TimeSignature(time_signature)
+        time_signatures_.append(time_signature)
+    return time_signatures_
+
+
 def enforce_time_signature(container: abjad.Container,
                            time_signatures: Union[abjad.TimeSignature,
                                                   tuple,
@@ -618,19 +656,7 @@ def enforce_time_signature(container: abjad.Container,
                         "child class")
     if not abjad.select(container).leaves().are_contiguous_logical_voice():
         raise ValueError("first argument must be contiguous logical voice")
-    if isinstance(time_signatures, list):
-        time_signatures_ = time_signatures[:]
-    else:
-        time_signatures_ = [time_signatures]
-    if time_signatures_[0] is None:
-        raise ValueError("first element of the input list must not be 'None'")
-    # converting all elements to abjad.TimeSignature
-    for index, time_signature in enumerate(time_signatures_):
-        if time_signature is None:
-            previous_ts_duration = time_signatures_[index - 1].pair
-            time_signatures_[index] = abjad.TimeSignature(previous_ts_duration)
-        elif not isinstance(time_signature, abjad.TimeSignature):
-            time_signatures_[index] = abjad.TimeSignature(time_signature)
+    time_signatures_ = _time_signature_list(time_signatures)
     partial_time_signature = None
     if time_signatures_[0].partial is not None:
         partial_time_signature = time_signatures_[0]
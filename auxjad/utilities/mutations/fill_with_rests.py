@@ -1,13 +1,110 @@
+from math import gcd
 from typing import Optional
 
 import abjad
 
-from ..inspect import inspect
 from .prettify_rewrite_meter import (
     prettify_rewrite_meter as prettify_rewrite_meter_function,
 )
 
 
+def _last_measure_time_signature(
+    container: abjad.Container,
+) -> tuple[abjad.TimeSignature, abjad.Duration]:
+    r"""Returns the time signature and the duration of the last measure of a
+    container, walking it backwards from its end instead of extracting all
+    time signatures and grouping all measures. Just like
+    |abjad.select().group_by_measure()|, measures are counted from the leaf
+    carrying the last time signature, disregarding partial time signatures.
+    """
+    time_signature = None
+    duration = abjad.Duration(0)
+    for leaf in abjad.iterate(container).leaves(grace=False, reverse=True):
+        duration += abjad.inspect(leaf).duration()
+        time_signature = abjad.inspect(leaf).indicator(abjad.TimeSignature)
+        if time_signature is not None:
+            break
+    if time_signature is None:
+        time_signature = abjad.TimeSignature((4, 4))
+    last_duration = abjad.inspect(container[-1]).duration()
+    measure_offset = ((duration - last_duration) // time_signature.duration
+                      * time_signature.duration)
+    if measure_offset > 0:
+        # same as extract_time_signatures(), which repeats the previous time
+        # signature's pair for measures without one
+        time_signature = abjad.TimeSignature(time_signature.pair)
+    return time_signature, duration - measure_offset
+
+
+def _last_measure_selection(container: abjad.Container,
+                            measure_duration: abjad.Duration,
+                            ) -> abjad.Selection:
+    r"""Selects the components at the end of a container which make up its
+    last measure, given the duration of that measure."""
+    components = []
+    duration = abjad.Duration(0)
+    for component in reversed(container):
+        duration += abjad.inspect(component).duration()
+        if duration > measure_duration:
+            break
+        components.append(component)
+    return abjad.select(components[::-1])
+
+
+def _underfull_pair(leaves: abjad.Selection) -> tuple[int, int]:
+    r"""Returns the duration missing to fill the last measure of a selection
+    of leaves as a ``(numerator, denominator)`` pair. Same logic as
+    :func:`auxjad.inspect().underfull_duration()`, but durations are
+    accumulated as reduced integer pairs instead of |abjad.Duration|.
+    """
+    # handling first leaf
+    time_signature = abjad.inspect(leaves[0]).effective(abjad.TimeSignature)
+    if time_signature is None:
+        time_signature = abjad.TimeSignature((4, 4))
+    measure_numerator, measure_denominator = time_signature.duration.pair
+    numerator, denominator = abjad.inspect(leaves[0]).duration().pair
+    # handling partial time signatures
+    if time_signature.partial is not None:
+        partial_numerator, partial_denominator = time_signature.partial.pair
+        numerator = (numerator * measure_denominator * partial_denominator
+                     + measure_numerator * denominator * partial_denominator
+                     - partial_numerator * denominator * measure_denominator)
+        denominator *= measure_denominator * partial_denominator
+    # all other leaves
+    for leaf in leaves[1:]:
+        time_signature_ = abjad.inspect(leaf).indicator(abjad.TimeSignature)
+        if time_signature_ is not None and time_signature_ != time_signature:
+            if ((numerator * measure_denominator)
+                    % (denominator * measure_numerator) != 0):
+                raise ValueError("'container' is malformed, with an underfull "
+                                 "measure preceding a time signature change")
+            time_signature = time_signature_
+            measure_numerator, measure_denominator = (
+                time_signature.duration.pair
+            )
+            numerator, denominator = 0, 1
+        leaf_numerator, leaf_denominator = (
+            abjad.inspect(leaf).duration().pair
+        )
+        numerator = (numerator * leaf_denominator
+                     + leaf_numerator * denominator)
+        denominator *= leaf_denominator
+        divisor = gcd(numerator, denominator)
+        numerator //= divisor
+        denominator //= divisor
+    # duration of the last measure, and what is left to fill it
+    numerator = ((numerator * measure_denominator)
+                 % (denominator * measure_numerator))
+    if numerator == 0:
+        return 0, 1
+    denominator *= measure_denominator
+    numerator = (measure_numerator * denominator
+                 - numerator * measure_denominator)
+    denominator *= measure_denominator
+    divisor = gcd(numerator, denominator)
+    return numerator // divisor, denominator // divisor
+
+
 def fill_with_rests(container: abjad.Container,
                     *,
                     disable_rewrite_meter: bool = False,
@@ -260,36 +357,51 @@ def fill_with_rests(container: abjad.Container,
     """
     if not isinstance(container, abjad.Container):
         raise TypeError("argument must be 'abjad.Container' or child class")
-    if not abjad.select(container).leaves().are_contiguous_logical_voice():
+    leaves = abjad.select(container).leaves()
+    if not leaves.are_contiguous_logical_voice():
         raise ValueError("argument must be contiguous logical voice")
-    try:
-        if not inspect(container[:]).selection_is_full():
-            underfull_rests = abjad.LeafMaker()(
-                None,
-                inspect(container[:]).underfull_duration(),
-            )
-            container.extend(underfull_rests)
-        else:
-            return
-    except ValueError as err:
+    # grace notes do not count towards the duration of measures
+    nongrace_leaves = abjad.select(container).leaves(grace=False)
+    if (len(nongrace_leaves) != len(leaves)
+            and not nongrace_leaves.are_contiguous_logical_voice()):
         raise ValueError("'container' is malformed, with an underfull measure "
-                         "preceding a time signature change") from err
+                         "preceding a time signature change")
+    underfull_numerator, underfull_denominator = _underfull_pair(
+        nongrace_leaves
+    )
+    if underfull_numerator == 0:
+        # no rests are appended, so there is no measure to be rewritten
+        return
+    underfull_rests = abjad.LeafMaker()(
+        None,
+        abjad.Duration(underfull_numerator, underfull_denominator),
+    )
+    container.extend(underfull_rests)
     if not disable_rewrite_meter:
-        time_signatures = inspect(container).extract_time_signatures(
-            do_not_use_none=True,
+        # this backward walk spans the whole container when no time signature
+        # is attached (as in the common case of an implicit 4/4), so it is
+        # only repeated after rewriting when the last measure does not last
+        # exactly as long as its time signature (e.g. rewrite_meter() splits a
+        # longer last measure into several measures)
+        time_signature, measure_duration = (
+            _last_measure_time_signature(container)
         )
-        measures = abjad.select(container[:]).group_by_measure()
-        abjad.mutate(measures[-1]).rewrite_meter(
-            time_signatures[-1],
+        last_measure = _last_measure_selection(container, measure_duration)
+        abjad.mutate(last_measure).rewrite_meter(
+            time_signature,
             boundary_depth=boundary_depth,
             maximum_dot_count=maximum_dot_count,
             rewrite_tuplets=rewrite_tuplets,
         )
         if prettify_rewrite_meter:
-            measures = abjad.select(container[:]).group_by_measure()
+            if measure_duration != time_signature.duration:
+                time_signature, measure_duration = (
+                    _last_measure_time_signature(container)
+                )
+            last_measure = _last_measure_selection(container, measure_duration)
             prettify_rewrite_meter_function(
-                measures[-1],
-                time_signatures[-1],
+                last_measure,
+                time_signature,
                 extract_trivial_tuplets=extract_trivial_tuplets,
                 fuse_across_groups_of_beats=fuse_across_groups_of_beats,
                 fuse_quadruple_meter=fuse_quadruple_meter,
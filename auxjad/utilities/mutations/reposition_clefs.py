@@ -1,10 +1,12 @@
 import abjad
 
+_DEFAULT_TREBLE_CLEF = abjad.Clef('treble')
+
 
 def reposition_clefs(selection: abjad.Selection,
                      *,
                      shift_clef_to_notes: bool = True,
-                     implicit_clef: abjad.Clef = abjad.Clef('treble'),
+                     implicit_clef: abjad.Clef = _DEFAULT_TREBLE_CLEF,
                      ) -> None:
     r"""Mutates an input |abjad.Selection| in place and has no return value;
     this function removes all consecutive repeated clefs. It can also be used
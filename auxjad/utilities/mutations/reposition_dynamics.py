@@ -509,7 +509,7 @@ def reposition_dynamics(selection: abjad.Selection,
                 and inspector.indicator(abjad.Dynamic) is not None):
             abjad.detach(abjad.StopHairpin, leaf)
     target_leaf = None
-    for leaf in leaves[::-1]:
+    for leaf in reversed(leaves):
         inspector = abjad.inspect(leaf)
         if inspector.indicator(abjad.StopHairpin) is not None:
             if target_leaf is not None:
@@ -1,6 +1,20 @@
 import abjad
 
 
+def _remove_slur_on_single_leaf(leaves: abjad.Selection,
+                                start_slurs: list,
+                                stop_slurs: list,
+                                index: int,
+                                ) -> None:
+    r"""Detaches both slur indicators of the leaf at ``index`` if it both
+    starts and stops a slur, updating the lists of slur indicators."""
+    if start_slurs[index] is not None and stop_slurs[index] is not None:
+        abjad.detach(abjad.StartSlur, leaves[index])
+        abjad.detach(abjad.StopSlur, leaves[index])
+        start_slurs[index] = None
+        stop_slurs[index] = None
+
+
 def reposition_slurs(selection: abjad.Selection,
                      *,
                      allow_slurs_under_rests: bool = False,
@@ -271,100 +285,132 @@ def reposition_slurs(selection: abjad.Selection,
     """
     if not isinstance(selection, abjad.Selection):
         raise TypeError("argument must be 'abjad.Container' or child class")
-    if not selection.leaves().are_contiguous_logical_voice():
+    leaves = selection.leaves()
+    if not leaves.are_contiguous_logical_voice():
         raise ValueError("argument must be contiguous logical voice")
     if not isinstance(allow_slurs_under_rests, bool):
         raise TypeError("'allow_slurs_under_rests' must be 'bool'")
     if not isinstance(close_unterminated_final_slur, bool):
         raise TypeError("'close_unterminated_final_slur' must be 'bool'")
 
-    leaves = selection.leaves()
+    # rest types and slurs of all leaves are inspected only once, with these
+    # lists being kept up to date whenever a slur is attached or detached
+    rests = [isinstance(leaf, (abjad.Rest, abjad.MultimeasureRest))
+             for leaf in leaves]
+    start_slurs = [abjad.inspect(leaf).indicator(abjad.StartSlur)
+                   for leaf in leaves]
+    stop_slurs = [abjad.inspect(leaf).indicator(abjad.StopSlur)
+                  for leaf in leaves]
+    if (all(start_slur is None for start_slur in start_slurs)
+            and all(stop_slur is None for stop_slur in stop_slurs)):
+        return
+    last_index = len(leaves) - 1
 
     # checking for final unfinished slurs
     if close_unterminated_final_slur:
-        for leaf in leaves[::-1]:
-            inspector = abjad.inspect(leaf)
-            if inspector.indicator(abjad.StartSlur) is not None:
-                if leaf is leaves[-1]:
-                    abjad.detach(abjad.StartSlur(), leaf)
-                elif (abjad.inspect(leaves[-1]).indicator(abjad.StopSlur)
-                        is None):
-                    abjad.attach(abjad.StopSlur(), leaves[-1])
-            if inspector.indicator(abjad.StopSlur) is not None:
+        for index in range(last_index, -1, -1):
+            if start_slurs[index] is not None:
+                if index == last_index:
+                    abjad.detach(abjad.StartSlur(), leaves[index])
+                    start_slurs[index] = abjad.inspect(
+                        leaves[index]
+                    ).indicator(abjad.StartSlur)
+                elif stop_slurs[last_index] is None:
+                    stop_slurs[last_index] = abjad.StopSlur()
+                    abjad.attach(stop_slurs[last_index], leaves[last_index])
+            if stop_slurs[index] is not None:
                 break
 
     # checking for duplicate open or close slurs
     start_slur_count = 0
     stop_slur_count = 0
-    for leaf in leaves:
-        inspector = abjad.inspect(leaf)
-        if inspector.indicator(abjad.StartSlur) is not None:
+    for index, leaf in enumerate(leaves):
+        if start_slurs[index] is not None:
             start_slur_count += 1
             stop_slur_count = 0
             if start_slur_count > 1:
                 abjad.detach(abjad.StartSlur(), leaf)
-        elif inspector.indicator(abjad.StopSlur) is not None:
+                start_slurs[index] = abjad.inspect(leaf).indicator(
+                    abjad.StartSlur
+                )
+        elif stop_slurs[index] is not None:
             stop_slur_count += 1
             start_slur_count = 0
             if stop_slur_count > 1:
                 abjad.detach(abjad.StopSlur(), leaf)
+                stop_slurs[index] = abjad.inspect(leaf).indicator(
+                    abjad.StopSlur
+                )
 
-    # shifting slurs from rests to notes
-    shifted_startslur = None
-    for leaf in leaves:
-        inspector = abjad.inspect(leaf)
-        if isinstance(leaf, (abjad.Rest, abjad.MultimeasureRest)):
-            if inspector.indicator(abjad.StartSlur) is not None:
-                shifted_startslur = inspector.indicator(abjad.StartSlur)
-                abjad.detach(abjad.StartSlur, leaf)
-        else:
-            if inspector.indicator(abjad.StartSlur) is None:
-                if shifted_startslur is not None:
-                    abjad.attach(shifted_startslur, leaf)
-                    shifted_startslur = None
+    # shifting stop slurs from rests to notes
     shifted_stopslur = None
-    for leaf in leaves[::-1]:
-        inspector = abjad.inspect(leaf)
-        if isinstance(leaf, (abjad.Rest, abjad.MultimeasureRest)):
-            if inspector.indicator(abjad.StopSlur) is not None:
-                shifted_stopslur = inspector.indicator(abjad.StopSlur)
+    for index in range(last_index, -1, -1):
+        leaf = leaves[index]
+        if rests[index]:
+            if stop_slurs[index] is not None:
+                shifted_stopslur = stop_slurs[index]
                 abjad.detach(abjad.StopSlur, leaf)
+                stop_slurs[index] = None
         else:
-            if inspector.indicator(abjad.StopSlur) is None:
+            if stop_slurs[index] is None:
                 if shifted_stopslur is not None:
                     abjad.attach(shifted_stopslur, leaf)
+                    stop_slurs[index] = shifted_stopslur
                     shifted_stopslur = None
 
-    # splitting slurs under rests
-    if not allow_slurs_under_rests:
-        active_slur = False
-        for index, leaf in enumerate(leaves):
-            inspector = abjad.inspect(leaf)
-            if inspector.indicator(abjad.StartSlur) is not None:
-                active_slur = True
-            elif inspector.indicator(abjad.StopSlur) is not None:
-                if not active_slur:
-                    abjad.detach(abjad.StopSlur, leaf)
-                active_slur = False
-            if (isinstance(leaf, (abjad.Rest, abjad.MultimeasureRest))
-                    and active_slur):
-                previous_leaf = abjad.select(leaf).with_previous_leaf()[0]
-                if (abjad.inspect(previous_leaf).indicator(abjad.StopSlur)
-                        is None):
-                    abjad.attach(abjad.StopSlur(), previous_leaf)
-                for next_leaf in leaves[index + 1:]:
-                    if not isinstance(next_leaf, (abjad.Rest,
-                                                  abjad.MultimeasureRest)):
-                        if (abjad.inspect(next_leaf).indicator(abjad.StartSlur)
-                                is None):
-                            abjad.attach(abjad.StartSlur(), next_leaf)
-                        break
-        for leaf in leaves:
-            inspector = abjad.inspect(leaf)
-            if (inspector.indicator(abjad.StartSlur) is not None
-                    and inspector.indicator(abjad.StopSlur) is not None):
+    # shifting start slurs from rests to notes and splitting slurs under
+    # rests in a single pass; a slur split at a rest is restarted at the next
+    # note unless that note already starts a slur (possibly a shifted one)
+    shifted_startslur = None
+    pending_startslur = False
+    active_slur = False
+    for index, leaf in enumerate(leaves):
+        if rests[index]:
+            if start_slurs[index] is not None:
+                shifted_startslur = start_slurs[index]
                 abjad.detach(abjad.StartSlur, leaf)
+                start_slurs[index] = None
+        else:
+            if start_slurs[index] is None:
+                if shifted_startslur is not None:
+                    abjad.attach(shifted_startslur, leaf)
+                    start_slurs[index] = shifted_startslur
+                    shifted_startslur = None
+            if pending_startslur:
+                if start_slurs[index] is None:
+                    start_slurs[index] = abjad.StartSlur()
+                    abjad.attach(start_slurs[index], leaf)
+                pending_startslur = False
+        if allow_slurs_under_rests:
+            continue
+        if start_slurs[index] is not None:
+            active_slur = True
+        elif stop_slurs[index] is not None:
+            if not active_slur:
                 abjad.detach(abjad.StopSlur, leaf)
+                stop_slurs[index] = None
+            active_slur = False
+        if rests[index] and active_slur:
+            if index > 0 and stop_slurs[index - 1] is None:
+                stop_slurs[index - 1] = abjad.StopSlur()
+                abjad.attach(stop_slurs[index - 1], leaves[index - 1])
+            pending_startslur = True
+        # removing slurs starting and stopping on the same leaf; this is done
+        # one leaf behind, since the step above can still attach a stop slur
+        # to the previous leaf
+        if index > 0:
+            _remove_slur_on_single_leaf(leaves,
+                                        start_slurs,
+                                        stop_slurs,
+                                        index - 1,
+                                        )
+
+    if not allow_slurs_under_rests and leaves:
+        _remove_slur_on_single_leaf(leaves,
+                                    start_slurs,
+                                    stop_slurs,
+                                    last_index,
+                                    )
 
     # removing slurs spanning a single logical tie
     for logical_tie in selection.logical_ties():
@@ -256,7 +256,7 @@ def rests_to_multimeasure_rest(selection: abjad.Selection,
             effective_time_signature = time_signature
         if all([isinstance(leaf, abjad.Rest) for leaf in measure.leaves()]):
             if not ignore_clefs:
-                for leaf in measure.leaves()[::-1]:
+                for leaf in reversed(measure.leaves()):
                     clef = abjad.inspect(leaf).indicator(abjad.Clef)
                     if clef is not None:
                         break
@@ -539,8 +539,8 @@ def sync_containers(containers: Union[Iterable[abjad.Container],
         duration_difference = max_duration - duration
         if duration_difference > abjad.Duration(0):
             # handling duration left in the last measure, if any
-            if not inspect(container[:]).selection_is_full():
-                duration_left = inspect(container[:]).underfull_duration()
+            duration_left = inspect(container[:]).underfull_duration()
+            if duration_left > abjad.Duration(0):
                 underfull_rests_duration = min(duration_difference,
                                                duration_left,
                                                )
@@ -555,7 +555,7 @@ def sync_containers(containers: Union[Iterable[abjad.Container],
                 if duration_difference == abjad.Duration(0):
                     continue
             # finding out last effective time signature
-            for leaf in abjad.select(container).leaves()[::-1]:
+            for leaf in reversed(abjad.select(container).leaves()):
                 effective_time_signature = abjad.inspect(leaf).effective(
                     abjad.TimeSignature
                 )
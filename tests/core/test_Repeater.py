@@ -414,3 +414,129 @@ def test_Repeater_14():
             f'4
         }
         """)
+
+
+def test_Repeater_15():
+    container = abjad.Container(r"\time 3/4 \clef bass f4\pp( e4) d4(")
+    repeater = auxjad.Repeater(container,
+                               reposition_clefs=False,
+                               )
+    notes = repeater(2)
+    staff = abjad.Staff(notes)
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            \time 3/4
+            \clef "bass"
+            f4
+            \pp
+            (
+            e4
+            )
+            d4
+            (
+            \clef "bass"
+            f4
+            e4
+            )
+            d4
+        }
+        """)
+
+
+def test_Repeater_16():
+    container = abjad.Container(r"c'4( d'4 e'4 f'4")
+    repeater = auxjad.Repeater(container)
+    notes = repeater(2)
+    staff = abjad.Staff(notes)
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            c'4
+            (
+            d'4
+            e'4
+            f'4
+            c'4
+            d'4
+            e'4
+            f'4
+            )
+        }
+        """)
+    notes = repeater(2)
+    staff = abjad.Staff(notes)
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            c'4
+            (
+            d'4
+            e'4
+            f'4
+            c'4
+            d'4
+            e'4
+            f'4
+            )
+        }
+        """)
+    repeater.reposition_slurs = False
+    notes = repeater(2)
+    staff = abjad.Staff(notes)
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            c'4
+            (
+            d'4
+            e'4
+            f'4
+            c'4
+            (
+            d'4
+            e'4
+            f'4
+        }
+        """)
+    repeater.contents = abjad.Container(r"g'2 a'2")
+    notes = repeater(2)
+    staff = abjad.Staff(notes)
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            g'2
+            a'2
+            g'2
+            a'2
+        }
+        """)
+
+
+def test_Repeater_17():
+    container = abjad.Container(r"c'4 d'4 e'4")
+    abjad.attach(auxjad.TimeSignature((3, 4)), container[0])
+    repeater = auxjad.Repeater(container)
+    notes = repeater(3)
+    staff = abjad.Staff(notes)
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            \time 3/4
+            c'4
+            d'4
+            e'4
+            c'4
+            d'4
+            e'4
+            c'4
+            d'4
+            e'4
+        }
+        """)
@@ -226,3 +226,45 @@ def test_fill_with_rests_07():
             r4.
         }
         """)
+
+
+def test_fill_with_rests_08():
+    staff = abjad.Staff(r"\grace{c'16} d'4 e'4")
+    auxjad.mutate(staff).fill_with_rests()
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            \grace {
+                c'16
+            }
+            d'4
+            e'4
+            r2
+        }
+        """)
+    staff = abjad.Staff(r"\time 3/4 c'4 \grace{c'16} d'4")
+    with pytest.raises(ValueError):
+        auxjad.mutate(staff).fill_with_rests()
+
+
+def test_fill_with_rests_09():
+    staff = abjad.Staff(r"e'4 \time 4/4 c'8 d'4 e'2")
+    auxjad.mutate(staff).fill_with_rests()
+    assert format(staff) == abjad.String.normalize(
+        r"""
+        \new Staff
+        {
+            e'4
+            \time 4/4
+            c'8
+            d'8
+            ~
+            d'8
+            e'8
+            ~
+            e'4.
+            r8
+            r2.
+        }
+        """)